@@ -5,10 +5,12 @@ from collections.abc import Callable, Generator
 from typing import Any, TypeVar, cast
 
 import httpx
+import orjson
 from pydantic import BaseModel
 from yarl import URL
 
 from configs import dify_config
+from core.helper.http_client_pooling import get_pooled_http_client
 from core.model_runtime.errors.invoke import (
     InvokeAuthorizationError,
     InvokeBadRequestError,
@@ -49,10 +51,37 @@ elif isinstance(_plugin_daemon_timeout_config, httpx.Timeout):
 else:
     plugin_daemon_request_timeout = httpx.Timeout(_plugin_daemon_timeout_config)
 
+_PLUGIN_DAEMON_POOL_KEY = "plugin_daemon:inner_api"
+_plugin_daemon_client_limits = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+
+def _get_plugin_daemon_client() -> httpx.Client:
+    """Return the shared keepalive client for the plugin daemon inner API."""
+    return get_pooled_http_client(
+        _PLUGIN_DAEMON_POOL_KEY,
+        lambda: httpx.Client(limits=_plugin_daemon_client_limits),
+    )
+
+
 T = TypeVar("T", bound=(BaseModel | dict[str, Any] | list[Any] | bool | str))
 
 logger = logging.getLogger(__name__)
 
+# Cache of parametrized response models so hot paths skip pydantic's generic
+# machinery on every request/stream line
+_daemon_response_models: dict[Any, type[PluginDaemonBasicResponse[Any]]] = {}
+
+
+def _daemon_response_model(type_: type[T]) -> type[PluginDaemonBasicResponse[T]]:
+    model = _daemon_response_models.get(type_)
+    if model is None:
+        model = _daemon_response_models[type_] = PluginDaemonBasicResponse[type_]  # type: ignore
+    return model
+
 
 class BasePluginClient:
     def _request(
@@ -83,7 +112,7 @@ class BasePluginClient:
             request_kwargs["content"] = prepared_data
 
         try:
-            response = httpx.request(**request_kwargs)
+            response = _get_plugin_daemon_client().request(**request_kwargs)
         except httpx.RequestError:
             logger.exception("Request to Plugin Daemon Service failed")
             raise PluginDaemonInnerError(code=-500, message="Request to Plugin Daemon Service failed")
@@ -170,7 +199,7 @@ class BasePluginClient:
             stream_kwargs["content"] = prepared_data
 
         try:
-            with httpx.stream(**stream_kwargs) as response:
+            with _get_plugin_daemon_client().stream(**stream_kwargs) as response:
                 for raw_line in response.iter_lines():
                     if not raw_line:
                         continue
@@ -242,11 +271,11 @@ class BasePluginClient:
             raise ValueError(msg) from e
 
         try:
-            json_response = response.json()
+            json_response = orjson.loads(response.content)
             if transformer:
                 json_response = transformer(json_response)
             # https://stackoverflow.com/questions/59634937/variable-foo-class-is-not-valid-as-type-but-why
-            rep = PluginDaemonBasicResponse[type_].model_validate(json_response)  # type: ignore
+            rep = _daemon_response_model(type_).model_validate(json_response)
         except Exception:
             msg = (
                 f"Failed to parse response from plugin daemon to PluginDaemonBasicResponse [{str(type_.__name__)}],"
@@ -281,9 +310,10 @@ class BasePluginClient:
         """
         Make a stream request to the plugin daemon inner API and yield the response as a model.
         """
+        response_model = _daemon_response_model(type_)
         for line in self._stream_request(method, path, params, headers, data, files):
             try:
-                rep = PluginDaemonBasicResponse[type_].model_validate_json(line)  # type: ignore
+                rep = response_model.model_validate_json(line)
             except (ValueError, TypeError):
                 # TODO modify this when line_data has code and message
                 try:
@@ -3,15 +3,17 @@ from pydantic import BaseModel
 from core.plugin.impl.base import BasePluginClient
 
 
+class DebuggingKeyResponse(BaseModel):
+    key: str
+
+
 class PluginDebuggingClient(BasePluginClient):
     def get_debugging_key(self, tenant_id: str) -> str:
         """
         Get the debugging key for the given tenant.
         """
-
-        class Response(BaseModel):
-            key: str
-
-        response = self._request_with_plugin_daemon_response("POST", f"plugin/{tenant_id}/debugging/key", Response)
+        response = self._request_with_plugin_daemon_response(
+            "POST", f"plugin/{tenant_id}/debugging/key", DebuggingKeyResponse
+        )
 
         return response.key
@@ -1,4 +1,5 @@
 from collections.abc import Generator
+from functools import partial
 from typing import Any
 
 from pydantic import BaseModel
@@ -12,38 +13,57 @@ from core.tools.entities.tool_entities import ToolInvokeMessage, ToolParameter
 from models.provider_ids import GenericProviderID, ToolProviderID
 
 
+class RuntimeParametersResponse(BaseModel):
+    parameters: list[ToolParameter]
+
+
+def _transform_tool_providers(json_response: dict[str, Any]) -> dict[str, Any]:
+    for provider in json_response.get("data", []):
+        declaration = provider.get("declaration", {}) or {}
+        provider_name = declaration.get("identity", {}).get("name")
+        for tool in declaration.get("tools", []):
+            tool["identity"]["provider"] = provider_name
+            # resolve refs
+            if tool.get("output_schema"):
+                tool["output_schema"] = resolve_dify_schema_refs(tool["output_schema"])
+
+    return json_response
+
+
+def _transform_tool_provider(json_response: dict[str, Any], provider_name: str) -> dict[str, Any]:
+    data = json_response.get("data")
+    if data:
+        for tool in data.get("declaration", {}).get("tools", []):
+            tool["identity"]["provider"] = provider_name
+            # resolve refs
+            if tool.get("output_schema"):
+                tool["output_schema"] = resolve_dify_schema_refs(tool["output_schema"])
+
+    return json_response
+
+
 class PluginToolManager(BasePluginClient):
     def fetch_tool_providers(self, tenant_id: str) -> list[PluginToolProviderEntity]:
         """
         Fetch tool providers for the given tenant.
         """
-
-        def transformer(json_response: dict[str, Any]):
-            for provider in json_response.get("data", []):
-                declaration = provider.get("declaration", {}) or {}
-                provider_name = declaration.get("identity", {}).get("name")
-                for tool in declaration.get("tools", []):
-                    tool["identity"]["provider"] = provider_name
-                    # resolve refs
-                    if tool.get("output_schema"):
-                        tool["output_schema"] = resolve_dify_schema_refs(tool["output_schema"])
-
-            return json_response
-
         response = self._request_with_plugin_daemon_response(
             "GET",
             f"plugin/{tenant_id}/management/tools",
             list[PluginToolProviderEntity],
             params={"page": 1, "page_size": 256},
-            transformer=transformer,
+            transformer=_transform_tool_providers,
         )
 
         for provider in response:
-            provider.declaration.identity.name = f"{provider.plugin_id}/{provider.declaration.identity.name}"
+            declaration = provider.declaration
+            identity = declaration.identity
+            new_name = f"{provider.plugin_id}/{identity.name}"
+            identity.name = new_name
 
             # override the provider name for each tool to plugin_id/provider_name
-            for tool in provider.declaration.tools:
-                tool.identity.provider = provider.declaration.identity.name
+            for tool in declaration.tools:
+                tool.identity.provider = new_name
 
         return response
 
@@ -53,30 +73,22 @@ class PluginToolManager(BasePluginClient):
         """
         tool_provider_id = ToolProviderID(provider)
 
-        def transformer(json_response: dict[str, Any]):
-            data = json_response.get("data")
-            if data:
-                for tool in data.get("declaration", {}).get("tools", []):
-                    tool["identity"]["provider"] = tool_provider_id.provider_name
-                    # resolve refs
-                    if tool.get("output_schema"):
-                        tool["output_schema"] = resolve_dify_schema_refs(tool["output_schema"])
-
-            return json_response
-
         response = self._request_with_plugin_daemon_response(
             "GET",
             f"plugin/{tenant_id}/management/tool",
             PluginToolProviderEntity,
             params={"provider": tool_provider_id.provider_name, "plugin_id": tool_provider_id.plugin_id},
-            transformer=transformer,
+            transformer=partial(_transform_tool_provider, provider_name=tool_provider_id.provider_name),
         )
 
-        response.declaration.identity.name = f"{response.plugin_id}/{response.declaration.identity.name}"
+        declaration = response.declaration
+        identity = declaration.identity
+        new_name = f"{response.plugin_id}/{identity.name}"
+        identity.name = new_name
 
         # override the provider name for each tool to plugin_id/provider_name
-        for tool in response.declaration.tools:
-            tool.identity.provider = response.declaration.identity.name
+        for tool in declaration.tools:
+            tool.identity.provider = new_name
 
         return response
 
@@ -149,10 +161,11 @@ class PluginToolManager(BasePluginClient):
             },
         )
 
-        for resp in response:
-            return resp.result
-
-        return False
+        try:
+            resp = next(response, None)
+        finally:
+            response.close()
+        return resp.result if resp is not None else False
 
     def validate_datasource_credentials(
         self, tenant_id: str, user_id: str, provider: str, credentials: dict[str, Any]
@@ -179,10 +192,11 @@ class PluginToolManager(BasePluginClient):
             },
         )
 
-        for resp in response:
-            return resp.result
-
-        return False
+        try:
+            resp = next(response, None)
+        finally:
+            response.close()
+        return resp.result if resp is not None else False
 
     def get_runtime_parameters(
         self,
@@ -200,9 +214,6 @@ class PluginToolManager(BasePluginClient):
         """
         tool_provider_id = GenericProviderID(provider)
 
-        class RuntimeParametersResponse(BaseModel):
-            parameters: list[ToolParameter]
-
         response = self._request_with_plugin_daemon_response_stream(
             "POST",
             f"plugin/{tenant_id}/dispatch/tool/get_runtime_parameters",
@@ -224,7 +235,8 @@ class PluginToolManager(BasePluginClient):
             },
         )
 
-        for resp in response:
-            return resp.parameters
-
-        return []
+        try:
+            resp = next(response, None)
+        finally:
+            response.close()
+        return resp.parameters if resp is not None else []
@@ -1,3 +1,4 @@
+import threading
 from collections.abc import Generator
 from dataclasses import dataclass, field
 from typing import TypeVar, Union
@@ -7,19 +8,86 @@ from core.tools.entities.tool_entities import ToolInvokeMessage
 
 MessageType = TypeVar("MessageType", bound=Union[ToolInvokeMessage, AgentInvokeMessage])
 
+_BUFFER_SIZE_CLASSES = (64 * 1024, 1024 * 1024, 8 * 1024 * 1024, 32 * 1024 * 1024)
+_MAX_POOLED_PER_CLASS = 4
 
-@dataclass
+
+class _BufferPool:
+    """
+    Thread-local pool of size-classed bytearrays reused across blob merges.
+
+    Buffers are kept per thread so acquire/release never contend across
+    workers; only the streams a thread is actively reading keep buffers live.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _free_lists(self) -> dict[int, list[bytearray]]:
+        free_lists: dict[int, list[bytearray]] | None = getattr(self._local, "free_lists", None)
+        if free_lists is None:
+            free_lists = self._local.free_lists = {size: [] for size in _BUFFER_SIZE_CLASSES}
+        return free_lists
+
+    def acquire(self, length: int) -> bytearray:
+        for size in _BUFFER_SIZE_CLASSES:
+            if length <= size:
+                free_list = self._free_lists()[size]
+                if free_list:
+                    return free_list.pop()
+                return bytearray(size)
+        # Larger than the biggest class; allocate exactly and never pool it
+        return bytearray(length)
+
+    def release(self, buffer: bytearray) -> None:
+        free_list = self._free_lists().get(len(buffer))
+        if free_list is not None and len(free_list) < _MAX_POOLED_PER_CLASS:
+            free_list.append(buffer)
+
+
+_buffer_pool = _BufferPool()
+
+
+@dataclass(slots=True)
 class FileChunk:
     """
     Buffer for accumulating file chunks during streaming.
+
+    The buffer starts at the smallest pool size class and grows through the
+    classes as data arrives; the daemon-declared total_length is advisory and
+    does not drive allocation, so a misreported length cannot commit tens of
+    megabytes for a payload that turns out to be small.
     """
 
     total_length: int
     bytes_written: int = field(default=0, init=False)
     data: bytearray = field(init=False)
+    view: memoryview = field(init=False)
 
     def __post_init__(self):
-        self.data = bytearray(self.total_length)
+        self.data = _buffer_pool.acquire(0)
+        # Cached view over the buffer so chunk writes skip bytearray slice-object
+        # creation; released before the merged blob is materialized.
+        self.view = memoryview(self.data)
+
+    def reserve(self, size: int) -> None:
+        """Grow the buffer to hold at least ``size`` bytes, preserving written data."""
+        if size <= len(self.data):
+            return
+        # Doubling keeps growth amortized O(n) once past the largest size class,
+        # where acquire() would otherwise allocate exactly and copy per chunk
+        new_data = _buffer_pool.acquire(max(size, 2 * len(self.data)))
+        new_view = memoryview(new_data)
+        new_view[: self.bytes_written] = self.view[: self.bytes_written]
+        self.view.release()
+        _buffer_pool.release(self.data)
+        self.data = new_data
+        self.view = new_view
+
+    def close(self) -> None:
+        """Release the exported view and return the buffer to the pool."""
+        self.view.release()
+        _buffer_pool.release(self.data)
 
 
 def merge_blob_chunks(
@@ -47,49 +115,65 @@ def merge_blob_chunks(
     """
     files: dict[str, FileChunk] = {}
 
-    for resp in response:
-        if resp.type == ToolInvokeMessage.MessageType.BLOB_CHUNK:
-            assert isinstance(resp.message, ToolInvokeMessage.BlobChunkMessage)
-            # Get blob chunk information
-            chunk_id = resp.message.id
-            total_length = resp.message.total_length
-            blob_data = resp.message.blob
-            is_end = resp.message.end
-
-            # Initialize buffer for this file if it doesn't exist
-            if chunk_id not in files:
-                files[chunk_id] = FileChunk(total_length)
-
-            # Check if file is too large (before appending)
-            if files[chunk_id].bytes_written + len(blob_data) > max_file_size:
-                # Delete the file if it's too large
-                del files[chunk_id]
-                raise ValueError(f"File is too large which reached the limit of {max_file_size / 1024 / 1024}MB")
-
-            # Check if single chunk is too large
-            if len(blob_data) > max_chunk_size:
-                raise ValueError(f"File chunk is too large which reached the limit of {max_chunk_size / 1024}KB")
-
-            # Append the blob data to the buffer
-            files[chunk_id].data[files[chunk_id].bytes_written : files[chunk_id].bytes_written + len(blob_data)] = (
-                blob_data
-            )
-            files[chunk_id].bytes_written += len(blob_data)
-
-            # If this is the final chunk, yield a complete blob message
-            if is_end:
-                # Create the appropriate message type based on the response type
-                message_class = type(resp)
-                merged_message = message_class(
-                    type=ToolInvokeMessage.MessageType.BLOB,
-                    message=ToolInvokeMessage.BlobMessage(
-                        blob=bytes(files[chunk_id].data[: files[chunk_id].bytes_written])
-                    ),
-                    meta=resp.meta,
-                )
-                assert isinstance(merged_message, (ToolInvokeMessage, AgentInvokeMessage))
-                yield merged_message  # type: ignore
-                # Clean up the buffer
-                del files[chunk_id]
-        else:
-            yield resp
+    # Drain the upstream generator in a single activation, yielding only at
+    # message boundaries (non-blob messages and final chunks). Burst-delivered
+    # chunks stay in the buffer-fill path without waking the consumer per chunk.
+    response_iter = iter(response)
+    try:
+        while True:
+            try:
+                resp = next(response_iter)
+            except StopIteration:
+                break
+            if resp.type == ToolInvokeMessage.MessageType.BLOB_CHUNK:
+                assert isinstance(resp.message, ToolInvokeMessage.BlobChunkMessage)
+                # Get blob chunk information
+                chunk_id = resp.message.id
+                blob_data = resp.message.blob
+                is_end = resp.message.end
+
+                # Initialize buffer for this file if it doesn't exist, probing the dict only once
+                file_chunk = files.get(chunk_id)
+                if file_chunk is None:
+                    file_chunk = files[chunk_id] = FileChunk(resp.message.total_length)
+                bytes_written = file_chunk.bytes_written
+                chunk_length = len(blob_data)
+                end = bytes_written + chunk_length
+
+                # Single bounds branch on the hot path; the distinction between the
+                # cumulative and per-chunk limit is only made once a limit is hit
+                if end > max_file_size or chunk_length > max_chunk_size:
+                    if end > max_file_size:
+                        raise ValueError(f"File is too large which reached the limit of {max_file_size / 1024 / 1024}MB")
+                    raise ValueError(f"File chunk is too large which reached the limit of {max_chunk_size / 1024}KB")
+
+                # Append the blob data to the buffer through the cached view,
+                # growing to the next size class when the chunk would overflow
+                if end > len(file_chunk.data):
+                    file_chunk.reserve(end)
+                file_chunk.view[bytes_written:end] = blob_data
+                file_chunk.bytes_written = end
+
+                # If this is the final chunk, yield a complete blob message
+                if is_end:
+                    # Release the view before materializing the blob so the bytearray is no longer exported
+                    file_chunk.view.release()
+                    # Create the appropriate message type based on the response type
+                    message_class = type(resp)
+                    merged_message = message_class(
+                        type=ToolInvokeMessage.MessageType.BLOB,
+                        message=ToolInvokeMessage.BlobMessage(blob=bytes(file_chunk.data[: file_chunk.bytes_written])),
+                        meta=resp.meta,
+                    )
+                    assert isinstance(merged_message, (ToolInvokeMessage, AgentInvokeMessage))
+                    # Recycle the buffer before suspending so it is returned even
+                    # if the consumer never resumes the generator
+                    files.pop(chunk_id).close()
+                    yield merged_message  # type: ignore
+            else:
+                yield resp
+    finally:
+        # Return any buffers still held (error or early close) to the pool
+        for file_chunk in files.values():
+            file_chunk.close()
+        files.clear()
@@ -10,6 +10,7 @@ Tests follow the Arrange-Act-Assert pattern for clarity.
 
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 
 from core.plugin.impl.endpoint import PluginEndpointClient
@@ -63,8 +64,9 @@ class TestPluginEndpointClientDelete:
             "message": "success",
             "data": True,
         }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act
             result = endpoint_client.delete_endpoint(
                 tenant_id=tenant_id,
@@ -101,8 +103,9 @@ class TestPluginEndpointClientDelete:
                 '"message": "failed to remove endpoint: record not found"}'
             ),
         }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act
             result = endpoint_client.delete_endpoint(
                 tenant_id=tenant_id,
@@ -138,8 +141,9 @@ class TestPluginEndpointClientDelete:
                 '"message": "failed to remove endpoint: internal server error"}'
             ),
         }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(PluginDaemonInternalServerError) as exc_info:
                 endpoint_client.delete_endpoint(
@@ -173,8 +177,9 @@ class TestPluginEndpointClientDelete:
             "code": -1,
             "message": '{"error_type": "PluginDaemonInternalServerError", "message": "Record Not Found"}',
         }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act
             result = endpoint_client.delete_endpoint(
                 tenant_id=tenant_id,
@@ -210,6 +215,7 @@ class TestPluginEndpointClientDelete:
             "message": "success",
             "data": True,
         }
+        mock_response_success.content = orjson.dumps(mock_response_success.json.return_value)
 
         # Second call - record not found
         mock_response_not_found = MagicMock()
@@ -221,8 +227,9 @@ class TestPluginEndpointClientDelete:
                 '"message": "failed to remove endpoint: record not found"}'
             ),
         }
+        mock_response_not_found.content = orjson.dumps(mock_response_not_found.json.return_value)
 
-        with patch("httpx.request") as mock_request:
+        with patch("httpx.Client.request") as mock_request:
             # Act - first call
             mock_request.return_value = mock_response_success
             result1 = endpoint_client.delete_endpoint(
@@ -265,8 +272,9 @@ class TestPluginEndpointClientDelete:
             "code": -1,
             "message": '{"error_type": "PluginDaemonUnauthorizedError", "message": "unauthorized access"}',
         }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(Exception) as exc_info:
                 endpoint_client.delete_endpoint(
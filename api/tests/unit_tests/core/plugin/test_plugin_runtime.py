@@ -16,6 +16,7 @@ from typing import Any
 from unittest.mock import MagicMock, patch
 
 import httpx
+import orjson
 import pytest
 from pydantic import BaseModel
 
@@ -113,8 +114,9 @@ class TestPluginRuntimeExecution:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": "success"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response) as mock_request:
+        with patch("httpx.Client.request", return_value=mock_response) as mock_request:
             # Act
             response = plugin_client._request("GET", "plugin/test-tenant/management/list")
 
@@ -132,7 +134,7 @@ class TestPluginRuntimeExecution:
         mock_response = MagicMock()
         mock_response.status_code = 200
 
-        with patch("httpx.request", return_value=mock_response) as mock_request:
+        with patch("httpx.Client.request", return_value=mock_response) as mock_request:
             # Act
             plugin_client._request("GET", "plugin/test-tenant/test")
 
@@ -143,7 +145,7 @@ class TestPluginRuntimeExecution:
     def test_request_connection_error(self, plugin_client, mock_config):
         """Test handling of connection errors during request."""
         # Arrange
-        with patch("httpx.request", side_effect=httpx.RequestError("Connection failed")):
+        with patch("httpx.Client.request", side_effect=httpx.RequestError("Connection failed")):
             # Act & Assert
             with pytest.raises(PluginDaemonInnerError) as exc_info:
                 plugin_client._request("GET", "plugin/test-tenant/test")
@@ -181,8 +183,9 @@ class TestPluginRuntimeSandboxIsolation:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"code": 0, "message": "", "data": True}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response) as mock_request:
+        with patch("httpx.Client.request", return_value=mock_response) as mock_request:
             # Act
             plugin_client._request("GET", "plugin/test-tenant/test")
 
@@ -200,8 +203,9 @@ class TestPluginRuntimeSandboxIsolation:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"code": 0, "message": "", "data": {"result": "isolated_execution"}}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act
             result = plugin_client._request_with_plugin_daemon_response(
                 "POST", "plugin/test-tenant/dispatch/tool/invoke", TestResponse, data={"tool": "test"}
@@ -217,8 +221,9 @@ class TestPluginRuntimeSandboxIsolation:
         mock_response.status_code = 200
         error_message = json.dumps({"error_type": "PluginDaemonUnauthorizedError", "message": "Unauthorized access"})
         mock_response.json.return_value = {"code": -1, "message": error_message, "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(PluginDaemonUnauthorizedError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("GET", "plugin/test-tenant/test", bool)
@@ -233,8 +238,9 @@ class TestPluginRuntimeSandboxIsolation:
             {"error_type": "PluginPermissionDeniedError", "message": "Permission denied for this operation"}
         )
         mock_response.json.return_value = {"code": -1, "message": error_message, "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(PluginPermissionDeniedError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("POST", "plugin/test-tenant/test", bool)
@@ -272,7 +278,7 @@ class TestPluginRuntimeResourceLimits:
         mock_response = MagicMock()
         mock_response.status_code = 200
 
-        with patch("httpx.request", return_value=mock_response) as mock_request:
+        with patch("httpx.Client.request", return_value=mock_response) as mock_request:
             # Act
             plugin_client._request("GET", "plugin/test-tenant/test")
 
@@ -283,7 +289,7 @@ class TestPluginRuntimeResourceLimits:
     def test_timeout_error_handling(self, plugin_client, mock_config):
         """Test handling of timeout errors."""
         # Arrange
-        with patch("httpx.request", side_effect=httpx.TimeoutException("Request timeout")):
+        with patch("httpx.Client.request", side_effect=httpx.TimeoutException("Request timeout")):
             # Act & Assert
             with pytest.raises(PluginDaemonInnerError) as exc_info:
                 plugin_client._request("GET", "plugin/test-tenant/test")
@@ -292,7 +298,7 @@ class TestPluginRuntimeResourceLimits:
     def test_streaming_request_timeout(self, plugin_client, mock_config):
         """Test timeout handling for streaming requests."""
         # Arrange
-        with patch("httpx.stream", side_effect=httpx.TimeoutException("Stream timeout")):
+        with patch("httpx.Client.stream", side_effect=httpx.TimeoutException("Stream timeout")):
             # Act & Assert
             with pytest.raises(PluginDaemonInnerError) as exc_info:
                 list(plugin_client._stream_request("POST", "plugin/test-tenant/stream"))
@@ -307,8 +313,9 @@ class TestPluginRuntimeResourceLimits:
             {"error_type": "PluginDaemonInternalServerError", "message": "Resource limit exceeded"}
         )
         mock_response.json.return_value = {"code": -1, "message": error_message, "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(PluginDaemonInternalServerError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("POST", "plugin/test-tenant/test", bool)
@@ -350,8 +357,9 @@ class TestPluginRuntimeErrorHandling:
         }
         error_message = json.dumps({"error_type": "PluginInvokeError", "message": json.dumps(invoke_error)})
         mock_response.json.return_value = {"code": -1, "message": error_message, "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(InvokeRateLimitError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("POST", "plugin/test-tenant/invoke", bool)
@@ -368,8 +376,9 @@ class TestPluginRuntimeErrorHandling:
         }
         error_message = json.dumps({"error_type": "PluginInvokeError", "message": json.dumps(invoke_error)})
         mock_response.json.return_value = {"code": -1, "message": error_message, "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(InvokeAuthorizationError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("POST", "plugin/test-tenant/invoke", bool)
@@ -386,8 +395,9 @@ class TestPluginRuntimeErrorHandling:
         }
         error_message = json.dumps({"error_type": "PluginInvokeError", "message": json.dumps(invoke_error)})
         mock_response.json.return_value = {"code": -1, "message": error_message, "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(InvokeBadRequestError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("POST", "plugin/test-tenant/invoke", bool)
@@ -404,8 +414,9 @@ class TestPluginRuntimeErrorHandling:
         }
         error_message = json.dumps({"error_type": "PluginInvokeError", "message": json.dumps(invoke_error)})
         mock_response.json.return_value = {"code": -1, "message": error_message, "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(InvokeConnectionError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("POST", "plugin/test-tenant/invoke", bool)
@@ -422,8 +433,9 @@ class TestPluginRuntimeErrorHandling:
         }
         error_message = json.dumps({"error_type": "PluginInvokeError", "message": json.dumps(invoke_error)})
         mock_response.json.return_value = {"code": -1, "message": error_message, "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(InvokeServerUnavailableError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("POST", "plugin/test-tenant/invoke", bool)
@@ -440,8 +452,9 @@ class TestPluginRuntimeErrorHandling:
         }
         error_message = json.dumps({"error_type": "PluginInvokeError", "message": json.dumps(invoke_error)})
         mock_response.json.return_value = {"code": -1, "message": error_message, "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(CredentialsValidateFailedError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("POST", "plugin/test-tenant/validate", bool)
@@ -456,8 +469,9 @@ class TestPluginRuntimeErrorHandling:
             {"error_type": "PluginNotFoundError", "message": "Plugin with ID 'test-plugin' not found"}
         )
         mock_response.json.return_value = {"code": -1, "message": error_message, "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(PluginNotFoundError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("GET", "plugin/test-tenant/get", bool)
@@ -472,8 +486,9 @@ class TestPluginRuntimeErrorHandling:
             {"error_type": "PluginUniqueIdentifierError", "message": "Invalid plugin identifier format"}
         )
         mock_response.json.return_value = {"code": -1, "message": error_message, "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(PluginUniqueIdentifierError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("POST", "plugin/test-tenant/install", bool)
@@ -488,8 +503,9 @@ class TestPluginRuntimeErrorHandling:
             {"error_type": "PluginDaemonBadRequestError", "message": "Missing required parameter"}
         )
         mock_response.json.return_value = {"code": -1, "message": error_message, "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(PluginDaemonBadRequestError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("POST", "plugin/test-tenant/test", bool)
@@ -502,8 +518,9 @@ class TestPluginRuntimeErrorHandling:
         mock_response.status_code = 200
         error_message = json.dumps({"error_type": "PluginDaemonNotFoundError", "message": "Resource not found"})
         mock_response.json.return_value = {"code": -1, "message": error_message, "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(PluginDaemonNotFoundError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("GET", "plugin/test-tenant/resource", bool)
@@ -520,8 +537,9 @@ class TestPluginRuntimeErrorHandling:
         )
         error_message = json.dumps({"error_type": "PluginInvokeError", "message": invoke_error_message})
         mock_response.json.return_value = {"code": -1, "message": error_message, "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(PluginInvokeError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("POST", "plugin/test-tenant/invoke", bool)
@@ -534,8 +552,9 @@ class TestPluginRuntimeErrorHandling:
         mock_response.status_code = 200
         error_message = json.dumps({"error_type": "UnknownErrorType", "message": "Unknown error occurred"})
         mock_response.json.return_value = {"code": -1, "message": error_message, "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(Exception) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("POST", "plugin/test-tenant/test", bool)
@@ -550,7 +569,7 @@ class TestPluginRuntimeErrorHandling:
             "Server Error", request=MagicMock(), response=mock_response
         )
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(httpx.HTTPStatusError):
                 plugin_client._request_with_plugin_daemon_response("GET", "plugin/test-tenant/test", bool)
@@ -561,8 +580,9 @@ class TestPluginRuntimeErrorHandling:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"code": 0, "message": "", "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(ValueError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("GET", "plugin/test-tenant/test", bool)
@@ -604,8 +624,9 @@ class TestPluginRuntimeCommunication:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"code": 0, "message": "", "data": {"value": "test", "count": 42}}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act
             result = plugin_client._request_with_plugin_daemon_response(
                 "POST", "plugin/test-tenant/test", TestModel, data={"input": "data"}
@@ -632,7 +653,7 @@ class TestPluginRuntimeCommunication:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act
@@ -662,7 +683,7 @@ class TestPluginRuntimeCommunication:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act
@@ -684,7 +705,7 @@ class TestPluginRuntimeCommunication:
     def test_streaming_connection_error(self, plugin_client, mock_config):
         """Test connection error during streaming."""
         # Arrange
-        with patch("httpx.stream", side_effect=httpx.RequestError("Stream connection failed")):
+        with patch("httpx.Client.stream", side_effect=httpx.RequestError("Stream connection failed")):
             # Act & Assert
             with pytest.raises(PluginDaemonInnerError) as exc_info:
                 list(plugin_client._stream_request("POST", "plugin/test-tenant/stream"))
@@ -701,8 +722,9 @@ class TestPluginRuntimeCommunication:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"status": "success", "data": {"key": "value"}}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act
             result = plugin_client._request_with_model("GET", "plugin/test-tenant/direct", DirectModel)
 
@@ -727,7 +749,7 @@ class TestPluginRuntimeCommunication:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act
@@ -759,7 +781,7 @@ class TestPluginRuntimeCommunication:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act
@@ -809,7 +831,7 @@ class TestPluginToolManagerIntegration:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act
@@ -839,7 +861,7 @@ class TestPluginToolManagerIntegration:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act
@@ -863,7 +885,7 @@ class TestPluginToolManagerIntegration:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act
@@ -887,7 +909,7 @@ class TestPluginToolManagerIntegration:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act
@@ -939,8 +961,9 @@ class TestPluginInstallerIntegration:
                 "total": 0,
             },
         }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act
             result = installer.list_plugins("test-tenant")
 
@@ -953,8 +976,9 @@ class TestPluginInstallerIntegration:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"code": 0, "message": "", "data": True}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act
             result = installer.uninstall("test-tenant", "plugin-installation-id")
 
@@ -967,8 +991,9 @@ class TestPluginInstallerIntegration:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"code": 0, "message": "", "data": True}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act
             result = installer.fetch_plugin_by_identifier("test-tenant", "plugin-identifier")
 
@@ -1005,9 +1030,9 @@ class TestPluginRuntimeEdgeCases:
         # Arrange
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
+        mock_response.content = b"not json"
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(ValueError):
                 plugin_client._request_with_plugin_daemon_response("GET", "plugin/test-tenant/test", bool)
@@ -1019,8 +1044,9 @@ class TestPluginRuntimeEdgeCases:
         mock_response.status_code = 200
         # Missing required fields in response
         mock_response.json.return_value = {"invalid": "structure"}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(ValueError):
                 plugin_client._request_with_plugin_daemon_response("GET", "plugin/test-tenant/test", bool)
@@ -1036,7 +1062,7 @@ class TestPluginRuntimeEdgeCases:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act
@@ -1060,7 +1086,7 @@ class TestPluginRuntimeEdgeCases:
         mock_response = MagicMock()
         mock_response.status_code = 200
 
-        with patch("httpx.request", return_value=mock_response) as mock_request:
+        with patch("httpx.Client.request", return_value=mock_response) as mock_request:
             # Act
             plugin_client._request("POST", "plugin/test-tenant/upload", data=b"binary data")
 
@@ -1076,7 +1102,7 @@ class TestPluginRuntimeEdgeCases:
 
         files = {"file": ("test.txt", b"file content", "text/plain")}
 
-        with patch("httpx.request", return_value=mock_response) as mock_request:
+        with patch("httpx.Client.request", return_value=mock_response) as mock_request:
             # Act
             plugin_client._request("POST", "plugin/test-tenant/upload", files=files)
 
@@ -1090,7 +1116,7 @@ class TestPluginRuntimeEdgeCases:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = []
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act
@@ -1110,7 +1136,7 @@ class TestPluginRuntimeEdgeCases:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act & Assert
@@ -1130,8 +1156,9 @@ class TestPluginRuntimeEdgeCases:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"code": -1, "message": "Plain text error message", "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(ValueError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("GET", "plugin/test-tenant/test", bool)
@@ -1168,8 +1195,9 @@ class TestPluginRuntimeAdvancedScenarios:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"code": 0, "message": "", "data": True}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response) as mock_request:
+        with patch("httpx.Client.request", return_value=mock_response) as mock_request:
             # Act
             for i in range(5):
                 result = plugin_client._request_with_plugin_daemon_response("GET", f"plugin/test-tenant/test/{i}", bool)
@@ -1197,8 +1225,9 @@ class TestPluginRuntimeAdvancedScenarios:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"code": 0, "message": "", "data": complex_data}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act
             result = plugin_client._request_with_plugin_daemon_response(
                 "POST", "plugin/test-tenant/complex", ComplexModel
@@ -1226,7 +1255,7 @@ class TestPluginRuntimeAdvancedScenarios:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act
@@ -1257,7 +1286,7 @@ class TestPluginRuntimeAdvancedScenarios:
             mock_response.status_code = 200
             return mock_response
 
-        with patch("httpx.request", side_effect=side_effect):
+        with patch("httpx.Client.request", side_effect=side_effect):
             # Act & Assert - First two calls should fail
             with pytest.raises(PluginDaemonInnerError):
                 plugin_client._request("GET", "plugin/test-tenant/test")
@@ -1281,7 +1310,7 @@ class TestPluginRuntimeAdvancedScenarios:
         mock_response = MagicMock()
         mock_response.status_code = 200
 
-        with patch("httpx.request", return_value=mock_response) as mock_request:
+        with patch("httpx.Client.request", return_value=mock_response) as mock_request:
             # Act
             plugin_client._request("GET", "plugin/test-tenant/test", headers=custom_headers)
 
@@ -1307,7 +1336,7 @@ class TestPluginRuntimeAdvancedScenarios:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act
@@ -1354,7 +1383,7 @@ class TestPluginRuntimeSecurityAndValidation:
         mock_response = MagicMock()
         mock_response.status_code = 200
 
-        with patch("httpx.request", return_value=mock_response) as mock_request:
+        with patch("httpx.Client.request", return_value=mock_response) as mock_request:
             # Act
             plugin_client._request("GET", "plugin/test-tenant/test")
 
@@ -1375,8 +1404,9 @@ class TestPluginRuntimeSecurityAndValidation:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"code": 0, "message": "", "data": True}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response) as mock_request:
+        with patch("httpx.Client.request", return_value=mock_response) as mock_request:
             # Act
             plugin_client._request_with_plugin_daemon_response(
                 "POST",
@@ -1397,8 +1427,9 @@ class TestPluginRuntimeSecurityAndValidation:
         mock_response.status_code = 200
         error_message = json.dumps({"error_type": "PluginDaemonUnauthorizedError", "message": "Invalid API key"})
         mock_response.json.return_value = {"code": -1, "message": error_message, "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(PluginDaemonUnauthorizedError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response("GET", "plugin/test-tenant/test", bool)
@@ -1418,8 +1449,9 @@ class TestPluginRuntimeSecurityAndValidation:
             {"error_type": "PluginDaemonBadRequestError", "message": "Invalid parameters: page must be positive"}
         )
         mock_response.json.return_value = {"code": -1, "message": error_message, "data": None}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert
             with pytest.raises(PluginDaemonBadRequestError) as exc_info:
                 plugin_client._request_with_plugin_daemon_response(
@@ -1433,7 +1465,7 @@ class TestPluginRuntimeSecurityAndValidation:
         mock_response = MagicMock()
         mock_response.status_code = 200
 
-        with patch("httpx.request", return_value=mock_response) as mock_request:
+        with patch("httpx.Client.request", return_value=mock_response) as mock_request:
             # Act
             plugin_client._request(
                 "POST", "plugin/test-tenant/test", headers={"Content-Type": "application/json"}, data={"key": "value"}
@@ -1484,7 +1516,7 @@ class TestPluginRuntimePerformanceScenarios:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act
@@ -1519,7 +1551,7 @@ class TestPluginRuntimePerformanceScenarios:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act - Process chunks one by one
@@ -1534,7 +1566,7 @@ class TestPluginRuntimePerformanceScenarios:
     def test_timeout_with_slow_response(self, plugin_client, mock_config):
         """Test timeout handling with slow response simulation."""
         # Arrange
-        with patch("httpx.request", side_effect=httpx.TimeoutException("Request timed out after 30s")):
+        with patch("httpx.Client.request", side_effect=httpx.TimeoutException("Request timed out after 30s")):
             # Act & Assert
             with pytest.raises(PluginDaemonInnerError) as exc_info:
                 plugin_client._request("GET", "plugin/test-tenant/slow-endpoint")
@@ -1546,10 +1578,11 @@ class TestPluginRuntimePerformanceScenarios:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"code": 0, "message": "", "data": True}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
         request_results = []
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act - Simulate 10 concurrent requests
             for i in range(10):
                 result = plugin_client._request_with_plugin_daemon_response(
@@ -1607,7 +1640,7 @@ class TestPluginToolManagerAdvanced:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act
@@ -1636,7 +1669,7 @@ class TestPluginToolManagerAdvanced:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act
@@ -1668,7 +1701,7 @@ class TestPluginToolManagerAdvanced:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act
@@ -1699,7 +1732,7 @@ class TestPluginToolManagerAdvanced:
         mock_response = MagicMock()
         mock_response.iter_lines.return_value = [line.encode("utf-8") for line in stream_data]
 
-        with patch("httpx.stream") as mock_stream:
+        with patch("httpx.Client.stream") as mock_stream:
             mock_stream.return_value.__enter__.return_value = mock_response
 
             # Act
@@ -1764,8 +1797,9 @@ class TestPluginInstallerAdvanced:
                 "verification": None,
             },
         }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act
             result = installer.upload_pkg("test-tenant", plugin_package, verify_signature=False)
 
@@ -1782,8 +1816,9 @@ class TestPluginInstallerAdvanced:
             "message": "",
             "data": {"content": "# Plugin README\n\nThis is a test plugin.", "language": "en"},
         }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act
             result = installer.fetch_plugin_readme("test-tenant", "test-org/test-plugin", "en")
 
@@ -1802,7 +1837,7 @@ class TestPluginInstallerAdvanced:
 
         mock_response.raise_for_status = raise_for_status
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act & Assert - Should raise HTTPStatusError for 404
             with pytest.raises(httpx.HTTPStatusError):
                 installer.fetch_plugin_readme("test-tenant", "test-org/test-plugin", "en")
@@ -1820,8 +1855,9 @@ class TestPluginInstallerAdvanced:
                 "total": 50,
             },
         }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act
             result = installer.list_plugins_with_total("test-tenant", page=2, page_size=20)
 
@@ -1842,8 +1878,9 @@ class TestPluginInstallerAdvanced:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"code": 0, "message": "", "data": [True, False]}
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
 
-        with patch("httpx.request", return_value=mock_response):
+        with patch("httpx.Client.request", return_value=mock_response):
             # Act
             result = installer.check_tools_existence("test-tenant", provider_ids)
 
@@ -13,7 +13,35 @@ class TestChunkMerger:
         chunk = FileChunk(1024)
         assert chunk.bytes_written == 0
         assert chunk.total_length == 1024
-        assert len(chunk.data) == 1024
+        # Allocation starts at the smallest pool class regardless of the
+        # declared length; the buffer grows as data actually arrives
+        assert len(chunk.data) >= 1024
+
+    def test_file_chunk_buffer_reuse(self):
+        """Test that a closed FileChunk's buffer is reused by the pool."""
+        chunk = FileChunk(1024)
+        buffer = chunk.data
+        chunk.close()
+        reused = FileChunk(2048)
+        assert reused.data is buffer
+        reused.close()
+
+    def test_file_chunk_declared_length_does_not_drive_allocation(self):
+        """Test that a large declared total_length does not preallocate the buffer."""
+        chunk = FileChunk(30 * 1024 * 1024)
+        assert len(chunk.data) < 1024 * 1024
+        chunk.close()
+
+    def test_file_chunk_reserve_preserves_data(self):
+        """Test that growing the buffer through size classes keeps written bytes."""
+        chunk = FileChunk(1024)
+        payload = b"payload-bytes"
+        chunk.view[: len(payload)] = payload
+        chunk.bytes_written = len(payload)
+        chunk.reserve(2 * 1024 * 1024)
+        assert len(chunk.data) >= 2 * 1024 * 1024
+        assert bytes(chunk.data[: len(payload)]) == payload
+        chunk.close()
 
     def test_merge_blob_chunks_with_single_complete_chunk(self):
         """Test merging a single complete blob chunk."""